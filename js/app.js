@@ -88,10 +88,23 @@ function capitalizeFirst(str) {
   return str.charAt(0).toUpperCase() + str.slice(1);
 }
 
+// Path data cache keyed by coordinates array (maps re-render on every interaction)
+const pathCache = new WeakMap();
+
 function coordsToPath(coords) {
   if (!coords || coords.length === 0) return '';
-  return `M ${coords[0][0]},${coords[0][1]} ` +
-    coords.slice(1).map(p => `L ${p[0]},${p[1]}`).join(' ') + ' Z';
+  const cached = pathCache.get(coords);
+  if (cached !== undefined) return cached;
+
+  // Build the path string in a single pass (no intermediate slice/map arrays)
+  let d = `M ${coords[0][0]},${coords[0][1]} `;
+  for (let i = 1; i < coords.length; i++) {
+    if (i > 1) d += ' ';
+    d += `L ${coords[i][0]},${coords[i][1]}`;
+  }
+  d += ' Z';
+  pathCache.set(coords, d);
+  return d;
 }
 
 function showToast(message, type = 'info') {
@@ -167,12 +180,14 @@ async function renderTemplateCards() {
     return;
   }
 
+  // Fetch all maps concurrently, then display them in manifest order
+  const templates = await Promise.all(mapFiles.map(loadTemplate));
+
   grid.innerHTML = '';
 
-  // Load and display each map
-  for (const filename of mapFiles) {
-    const data = await loadTemplate(filename);
-    if (!data) continue;
+  mapFiles.forEach((filename, index) => {
+    const data = templates[index];
+    if (!data) return;
 
     const card = document.createElement('div');
     card.className = 'template-card';
@@ -193,7 +208,7 @@ async function renderTemplateCards() {
     card.addEventListener('click', () => selectTemplate(filename, data));
 
     grid.appendChild(card);
-  }
+  });
 }
 
 // ================================
@@ -234,6 +249,14 @@ function renderSetupMap() {
   const provincesGroup = document.createElementNS('http://www.w3.org/2000/svg', 'g');
   provincesGroup.id = 'provinces-group';
 
+  // Resolve the province being configured once, not per rendered province
+  let currentProvinceId = null;
+  if (state.setup.step === 3) {
+    const sortedProvinces = [...data.provinces].sort((a, b) => a.id.localeCompare(b.id));
+    const currentProvince = sortedProvinces[state.setup.currentProvinceIndex];
+    currentProvinceId = currentProvince ? currentProvince.id : null;
+  }
+
   data.provinces.forEach(province => {
     const group = document.createElementNS('http://www.w3.org/2000/svg', 'g');
     group.id = `province-${province.id}`;
@@ -256,12 +279,8 @@ function renderSetupMap() {
     }
 
     // Highlight current province in step 3
-    if (state.setup.step === 3) {
-      const sortedProvinces = [...data.provinces].sort((a, b) => a.id.localeCompare(b.id));
-      const currentProvince = sortedProvinces[state.setup.currentProvinceIndex];
-      if (currentProvince && province.id === currentProvince.id) {
-        path.classList.add('current');
-      }
+    if (province.id === currentProvinceId) {
+      path.classList.add('current');
     }
 
     path.setAttribute('stroke', '#3D4559');
@@ -326,15 +345,24 @@ function renderSetupMap() {
   svg.appendChild(provincesGroup);
 }
 
+// Bounds cache keyed by coordinates array, shared by the setup and play maps
+const boundsCache = new WeakMap();
+
 function getProvinceBounds(coords) {
-  const xs = coords.map(c => c[0]);
-  const ys = coords.map(c => c[1]);
-  return {
-    minX: Math.min(...xs),
-    maxX: Math.max(...xs),
-    minY: Math.min(...ys),
-    maxY: Math.max(...ys)
-  };
+  const cached = boundsCache.get(coords);
+  if (cached) return cached;
+
+  // Single pass over the vertices; avoids temporary x/y arrays and spread arguments
+  let minX = Infinity, maxX = -Infinity, minY = Infinity, maxY = -Infinity;
+  for (const [x, y] of coords) {
+    if (x < minX) minX = x;
+    if (x > maxX) maxX = x;
+    if (y < minY) minY = y;
+    if (y > maxY) maxY = y;
+  }
+  const bounds = { minX, maxX, minY, maxY };
+  boundsCache.set(coords, bounds);
+  return bounds;
 }
 
 function getTerrainEmoji(terrain) {